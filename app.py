@@ -1,9 +1,18 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta, date
-import json
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+import orjson
 import os
 import calendar
+import functools
+import heapq
+from collections import defaultdict
 
 # Set page config
 st.set_page_config(
@@ -12,104 +21,250 @@ st.set_page_config(
     layout="wide"
 )
 
-# Function to save data to local JSON file
-def save_data():
+DATA_FILE = 'lifestyle_tracker_data.jsonl'
+LEGACY_DATA_FILE = 'lifestyle_tracker_data.json'
+
+# Function to save a single day's entry to the local JSONL file
+# Appends an O(1) delta line instead of rewriting the whole file; the last
+# line for a date wins on load
+def save_data(date_str):
     try:
-        # Convert date objects to strings for JSON serialization
-        data_to_save = {}
-        for date_str, data in st.session_state.tracker_data.items():
-            data_to_save[date_str] = data.copy()
-            
-        with open('lifestyle_tracker_data.json', 'w') as f:
-            json.dump(data_to_save, f, indent=2, default=str)
+        entry = st.session_state.tracker_data[date_str]
+        with open(DATA_FILE, 'ab') as f:
+            f.write(orjson.dumps({date_str: entry}) + b'\n')
     except Exception as e:
         st.error(f"Error saving data: {e}")
 
-# Function to load data from local JSON file
-def load_data():
+# Normalize an entry to a flat numeric schema: ints for times/steps, floats
+# with a 0.0 sentinel for weight/blood sugar. Keeps the aggregation path free
+# of None checks and `or 0` guards
+def _normalize_entry(entry):
+    entry['treadmill_time'] = int(entry.get('treadmill_time') or 0)
+    entry['steps'] = int(entry.get('steps') or 0) # Changed 'additional_walk' to 'steps'
+    entry['lunch_walk_time'] = int(entry.get('lunch_walk_time') or 0)
+    entry['strength_training'] = bool(entry.get('strength_training'))
+    entry['weight'] = float(entry.get('weight') or 0.0)
+    entry['blood_sugar'] = float(entry.get('blood_sugar') or 0.0)
+    return entry
+
+# Rewrite the JSONL file with one line per date, dropping superseded lines
+def _compact_data_file(data):
+    with open(DATA_FILE, 'wb') as f:
+        for date_str, entry in data.items():
+            f.write(orjson.dumps({date_str: entry}) + b'\n')
+
+# Function to load data from the local JSONL file
+# Cached across sessions; mtime is part of the cache key so the file is only
+# re-read and re-parsed when it actually changes on disk
+@st.cache_resource(show_spinner=False)
+def load_data(path=DATA_FILE, mtime=None):
     try:
-        if os.path.exists('lifestyle_tracker_data.json'):
-            with open('lifestyle_tracker_data.json', 'r') as f:
-                return json.load(f)
+        if os.path.exists(path):
+            data = {}
+            num_lines = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        data.update(orjson.loads(line))
+                        num_lines += 1
+            # Normalize entries saved before the schema was flattened
+            for entry in data.values():
+                _normalize_entry(entry)
+            # Compact on startup once appended edits outnumber the dates
+            if num_lines > len(data):
+                _compact_data_file(data)
+            return data
+        # Migrate the old single-document JSON file if present
+        if os.path.exists(LEGACY_DATA_FILE):
+            with open(LEGACY_DATA_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+            for entry in data.values():
+                _normalize_entry(entry)
+            _compact_data_file(data)
+            return data
     except Exception as e:
         st.error(f"Error loading data: {e}")
     return {}
 
+def _data_file_mtime(path=DATA_FILE):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
 # Initialize session state for data storage
 if 'tracker_data' not in st.session_state:
-    st.session_state.tracker_data = load_data()
+    st.session_state.tracker_data = load_data(mtime=_data_file_mtime())
 
-# Function to get program dates
-def get_program_info():
-    start_date = date(2025, 6, 2)  # June 2, 2025
-    end_date = start_date + timedelta(weeks=30)
-    return start_date, end_date
+# Version counter bumped on every save so cached views know when to rebuild
+if 'tracker_version' not in st.session_state:
+    st.session_state.tracker_version = 0
 
-# Function to get week number from date
-def get_week_number(target_date):
-    start_date, _ = get_program_info()
-    if isinstance(target_date, str):
-        target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-    
-    days_diff = (target_date - start_date).days
+# Program constants - 30 weeks starting June 2, 2025
+PROGRAM_START = date(2025, 6, 2)
+PROGRAM_END = PROGRAM_START + timedelta(weeks=30)
+PROGRAM_DAYS = 210
+
+# Program weeks run Monday-Sunday (the start date is a Monday)
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Template row for days with no entry in the weekly breakdown
+EMPTY_DAY_ROW = {
+    'Day': '-',
+    'Date': '-',
+    'Treadmill': '-',
+    'Steps': '-', # Changed label
+    'Lunch Walk': '-',
+    'Total Exercise': '-',
+    'Strength': '-',
+    'Weight': '-'
+}
+
+# Memoized week lookup - the input set is at most 210 unique date strings,
+# so repeated calls become a dict hit instead of a parse + date arithmetic
+@functools.lru_cache(maxsize=256)
+def _week_num_from_str(date_str):
+    days_diff = (date.fromisoformat(date_str) - PROGRAM_START).days
     week_num = (days_diff // 7) + 1
     return max(1, min(30, week_num))
 
+# Function to get week number from date
+def get_week_number(target_date):
+    if not isinstance(target_date, str):
+        target_date = target_date.isoformat()
+    return _week_num_from_str(target_date)
+
 # Function to check if strength training is available
 def is_strength_available(target_date):
     week_num = get_week_number(target_date)
     return week_num >= 3
 
-# Function to get summary stats
-def get_summary_stats(data_dict):
-    if not data_dict:
-        return {}
-    
-    total_days = len(data_dict)
-    total_treadmill = sum(data.get('treadmill_time', 0) or 0 for data in data_dict.values())
-    total_steps = sum(data.get('steps', 0) or 0 for data in data_dict.values()) # Changed 'additional_walk' to 'steps'
-    total_lunch_walks = sum(data.get('lunch_walk_time', 0) or 0 for data in data_dict.values())
-    strength_sessions = sum(1 for data in data_dict.values() if data.get('strength_training', False))
-    
+# Function to build the columnar view of tracker_data
+# Rebuilt only when the version counter says the data actually changed
+def get_tracker_df():
+    version = st.session_state.tracker_version
+    if st.session_state.get('tracker_df_version') == version and 'tracker_df' in st.session_state:
+        return st.session_state.tracker_df
+
+    data_dict = st.session_state.tracker_data
+    entries = list(data_dict.values())
+    df = pd.DataFrame({
+        'week': [data.get('week', get_week_number(date_str)) for date_str, data in data_dict.items()],
+        'treadmill_time': [data['treadmill_time'] for data in entries],
+        'steps': [data['steps'] for data in entries], # Changed 'additional_walk' to 'steps'
+        'lunch_walk_time': [data['lunch_walk_time'] for data in entries],
+        'strength_training': [data['strength_training'] for data in entries],
+        'weight': [data['weight'] for data in entries],
+        'blood_sugar': [data['blood_sugar'] for data in entries]
+    }, index=pd.to_datetime(list(data_dict.keys()), format='%Y-%m-%d')).sort_index()
+
+    st.session_state.tracker_df = df
+    st.session_state.tracker_df_version = version
+    return df
+
+# Function to build the date index keyed by (year, month) and program week
+# Rebuilt only when the version counter says the data actually changed, so
+# views look up their date keys instead of re-parsing every key per rerun
+def get_date_index():
+    version = st.session_state.tracker_version
+    if st.session_state.get('date_index_version') == version and 'date_index' in st.session_state:
+        return st.session_state.date_index
+
+    by_month = defaultdict(list)
+    by_week = defaultdict(list)
+    for date_str, data in sorted(st.session_state.tracker_data.items()):
+        d = date.fromisoformat(date_str)  # C fast path for YYYY-MM-DD
+        by_month[(d.year, d.month)].append(date_str)
+        by_week[data.get('week', get_week_number(d))].append(date_str)
+
+    date_index = {'by_month': by_month, 'by_week': by_week}
+    st.session_state.date_index = date_index
+    st.session_state.date_index_version = version
+    return date_index
+
+# Single-pass aggregation kernel over the numeric columns
+# Compiled with Numba when available; the pure-Python version is the fallback
+def _stats_kernel(treadmill, steps, lunch, strength, weight, blood_sugar):
+    total_treadmill = 0
+    total_steps = 0
+    total_lunch_walks = 0
+    strength_sessions = 0
+    weight_sum = 0.0
+    weight_n = 0
+    first_weight = 0.0
+    last_weight = 0.0
+    bs_sum = 0.0
+    bs_n = 0
+
+    for i in range(treadmill.shape[0]):
+        total_treadmill += treadmill[i]
+        total_steps += steps[i]
+        total_lunch_walks += lunch[i]
+        if strength[i]:
+            strength_sessions += 1
+        w = weight[i]
+        if w == w and w > 0:  # NaN-safe check
+            if weight_n == 0:
+                first_weight = w
+            last_weight = w
+            weight_sum += w
+            weight_n += 1
+        b = blood_sugar[i]
+        if b == b and b > 0:
+            bs_sum += b
+            bs_n += 1
+
+    return (total_treadmill, total_steps, total_lunch_walks, strength_sessions,
+            weight_sum, weight_n, first_weight, last_weight, bs_sum, bs_n)
+
+if njit is not None:
+    _stats_kernel = njit(cache=True)(_stats_kernel)
+
+# Cached summary computation over a DataFrame slice - one JIT-compiled pass
+# over contiguous arrays instead of per-entry dict lookups
+@st.cache_data(show_spinner=False)
+def _summary_stats_cached(df):
+    total_days = len(df)
+    (total_treadmill, total_steps, total_lunch_walks, strength_sessions,
+     weight_sum, weight_n, first_weight, last_weight, bs_sum, bs_n) = _stats_kernel(
+        df['treadmill_time'].to_numpy(dtype=np.int64),
+        df['steps'].to_numpy(dtype=np.int64), # Changed 'additional_walk' to 'steps'
+        df['lunch_walk_time'].to_numpy(dtype=np.int64),
+        df['strength_training'].to_numpy(dtype=np.bool_),
+        df['weight'].to_numpy(dtype=np.float64, na_value=np.nan),
+        df['blood_sugar'].to_numpy(dtype=np.float64, na_value=np.nan)
+    )
+
     # Calculate total exercise time including lunch walks
     total_exercise_time = total_treadmill + (total_steps / 100) + total_lunch_walks # Assuming 100 steps roughly equals 1 minute for cumulative calculation, adjust as needed
-    
-    # Handle None values properly for weights and blood sugar
-    weights = []
-    blood_sugars = []
-    
-    for data in data_dict.values():
-        weight = data.get('weight')
-        if weight is not None and weight > 0:
-            weights.append(weight)
-        
-        blood_sugar = data.get('blood_sugar')
-        if blood_sugar is not None and blood_sugar > 0:
-            blood_sugars.append(blood_sugar)
-    
+
     return {
         'total_days': total_days,
         'total_treadmill': total_treadmill,
         'avg_treadmill': total_treadmill / total_days if total_days > 0 else 0,
-        'total_steps': total_steps, # Changed 'total_walks' to 'total_steps'
+        'total_steps': total_steps,
         'avg_steps': total_steps / total_days if total_days > 0 else 0, # Changed 'avg_walks' to 'avg_steps'
         'total_lunch_walks': total_lunch_walks,
         'avg_lunch_walks': total_lunch_walks / total_days if total_days > 0 else 0,
         'total_exercise_time': total_exercise_time,
         'avg_exercise_time': total_exercise_time / total_days if total_days > 0 else 0,
         'strength_sessions': strength_sessions,
-        'avg_weight': sum(weights) / len(weights) if weights else 0,
-        'latest_weight': weights[-1] if weights else 0,
-        'avg_blood_sugar': sum(blood_sugars) / len(blood_sugars) if blood_sugars else 0,
-        'weight_change': weights[-1] - weights[0] if len(weights) > 1 else 0
+        'avg_weight': weight_sum / weight_n if weight_n > 0 else 0,
+        'latest_weight': last_weight if weight_n > 0 else 0,
+        'avg_blood_sugar': bs_sum / bs_n if bs_n > 0 else 0,
+        'weight_change': last_weight - first_weight if weight_n > 1 else 0
     }
 
+# Function to get summary stats from a DataFrame slice
+def get_summary_stats(df):
+    if df is None or df.empty:
+        return {}
+    return _summary_stats_cached(df)
+
 def main():
     st.title("🏃‍♂️ Daily Lifestyle Tracker")
     st.markdown("Track your daily journey to better health and wellness!")
-    
-    start_date, end_date = get_program_info()
-    
+
     # Sidebar for navigation
     st.sidebar.title("📅 Navigation")
     
@@ -132,19 +287,25 @@ def show_daily_entry():
     st.header("📝 Daily Entry")
     
     # Date selection
-    start_date, end_date = get_program_info()
     selected_date = st.date_input(
         "Select Date:",
-        value=date.today() if start_date <= date.today() <= end_date else start_date,
-        min_value=start_date,
-        max_value=end_date
+        value=date.today() if PROGRAM_START <= date.today() <= PROGRAM_END else PROGRAM_START,
+        min_value=PROGRAM_START,
+        max_value=PROGRAM_END
     )
     
     date_str = selected_date.strftime("%Y-%m-%d")
     week_num = get_week_number(selected_date)
     
     st.info(f"📅 {selected_date.strftime('%A, %B %d, %Y')} - Week {week_num} of 30")
-    
+
+    _entry_form(selected_date, date_str, week_num)
+
+# Fragment so interacting with the form only reruns this block, not the
+# whole script; the recent-entries panel lives here too so it refreshes on
+# submit without a full-app rerun
+@st.fragment
+def _entry_form(selected_date, date_str, week_num):
     # Form for daily entry
     with st.form(f"daily_entry_{date_str}"):
         col1, col2 = st.columns(2)
@@ -229,37 +390,42 @@ def show_daily_entry():
                 'steps': steps, # Changed 'additional_walk' to 'steps'
                 'lunch_walk_time': lunch_walk_time,
                 'strength_training': strength_training,
-                'weight': weight if weight and weight > 0 else None,
-                'blood_sugar': blood_sugar if blood_sugar and blood_sugar > 0 else None,
+                'weight': weight,
+                'blood_sugar': blood_sugar,
                 'mood_energy': mood_energy
             }
+            # Keep the stored schema flat numeric (0/0.0 sentinels, no None)
+            _normalize_entry(st.session_state.tracker_data[date_str])
             
+            st.session_state.tracker_version += 1
             st.success(f"✅ Data saved for {selected_date.strftime('%B %d, %Y')}!")
-            save_data()
+            save_data(date_str)
     
     # Show recent entries
     if st.session_state.tracker_data:
         st.subheader("📋 Recent Entries")
-        recent_data = dict(sorted(st.session_state.tracker_data.items(), reverse=True)[:7])
-        
-        for date_str, data in recent_data.items():
-            with st.expander(f"{date_str} - Week {data.get('week', 'N/A')}"):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.write(f"🏃‍♂️ Treadmill: {data.get('treadmill_time', 0)} min")
-                    st.write(f"🚶‍♂️ Steps: {data.get('steps', 0)}") # Changed label and variable
-                with col2:
-                    st.write(f"🍽️ Lunch Walk: {data.get('lunch_walk_time', 0)} min")
-                    st.write(f"💪 Strength: {'✅' if data.get('strength_training') else '❌'}")
-                with col3:
-                    if data.get('weight'):
-                        st.write(f"⚖️ Weight: {data.get('weight')} kg")
-                    if data.get('blood_sugar'):
-                        st.write(f"🩸 Blood Sugar: {data.get('blood_sugar')}")
-                
-                if data.get('mood_energy'):
-                    st.write(f"😊 Mood: {data.get('mood_energy')}")
+        # ISO date strings sort chronologically, so the 7 largest keys are the
+        # 7 most recent days - O(N log 7) instead of a full sort per rerun
+        recent_items = heapq.nlargest(7, st.session_state.tracker_data.items(), key=lambda kv: kv[0])
+
+        # One batched dataframe render instead of ~7 expanders x 6 writes
+        recent_rows = []
+        for date_str, data in recent_items:
+            recent_rows.append({
+                'Date': date_str,
+                'Week': data.get('week', 'N/A'),
+                'Treadmill (min)': data.get('treadmill_time', 0),
+                'Steps': data.get('steps', 0), # Changed 'additional_walk' to 'steps'
+                'Lunch Walk (min)': data.get('lunch_walk_time', 0),
+                'Strength': '✅' if data.get('strength_training') else '❌',
+                'Weight (kg)': data.get('weight') if data.get('weight') else '-',
+                'Blood Sugar': data.get('blood_sugar') if data.get('blood_sugar') else '-',
+                'Mood': data.get('mood_energy', '')
+            })
+        st.dataframe(pd.DataFrame(recent_rows), use_container_width=True, hide_index=True)
 
+# Fragment so switching weeks reruns only this panel
+@st.fragment
 def show_weekly_summary():
     st.header("📊 Weekly Summary")
     
@@ -271,23 +437,19 @@ def show_weekly_summary():
     )
     
     # Calculate week date range
-    start_date, _ = get_program_info()
-    week_start = start_date + timedelta(weeks=selected_week-1)
+    week_start = PROGRAM_START + timedelta(weeks=selected_week-1)
     week_end = week_start + timedelta(days=6)
     
     st.info(f"📅 Week {selected_week}: {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}")
     
-    # Get week data
-    week_data = {}
-    for i in range(7):
-        day_date = week_start + timedelta(days=i)
-        date_str = day_date.strftime("%Y-%m-%d")
-        if date_str in st.session_state.tracker_data:
-            week_data[date_str] = st.session_state.tracker_data[date_str]
-    
-    if week_data:
+    # Get week data as a DataFrame slice via the prebuilt week index
+    df = get_tracker_df()
+    week_dates = get_date_index()['by_week'].get(selected_week, [])
+    week_df = df.loc[pd.to_datetime(week_dates, format='%Y-%m-%d')]
+
+    if not week_df.empty:
         # Weekly stats
-        stats = get_summary_stats(week_data)
+        stats = get_summary_stats(week_df)
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -307,37 +469,31 @@ def show_weekly_summary():
         # Daily breakdown
         st.subheader("📅 Daily Breakdown")
         daily_df = []
+        tracker_data = st.session_state.tracker_data
         for i in range(7):
             day_date = week_start + timedelta(days=i)
-            date_str = day_date.strftime("%Y-%m-%d")
-            day_name = day_date.strftime("%A")
-            
-            if date_str in week_data:
-                data = week_data[date_str]
-                total_day_exercise = (data.get('treadmill_time', 0) + 
-                                      (data.get('steps', 0) / 100) + # Using steps in total exercise calculation
-                                      data.get('lunch_walk_time', 0))
+            day_mmdd = f"{day_date.month:02d}/{day_date.day:02d}"
+
+            data = tracker_data.get(day_date.isoformat())
+            if data is not None:
+                total_day_exercise = (data['treadmill_time'] +
+                                      (data['steps'] / 100) + # Using steps in total exercise calculation
+                                      data['lunch_walk_time'])
                 daily_df.append({
-                    'Day': day_name,
-                    'Date': day_date.strftime("%m/%d"),
-                    'Treadmill': data.get('treadmill_time', 0),
-                    'Steps': data.get('steps', 0), # Changed label
-                    'Lunch Walk': data.get('lunch_walk_time', 0),
+                    'Day': DAY_NAMES[i],
+                    'Date': day_mmdd,
+                    'Treadmill': data['treadmill_time'],
+                    'Steps': data['steps'], # Changed label
+                    'Lunch Walk': data['lunch_walk_time'],
                     'Total Exercise': total_day_exercise,
-                    'Strength': '✅' if data.get('strength_training') else '❌',
-                    'Weight': f"{data.get('weight', 0):.1f}" if data.get('weight') else '-'
+                    'Strength': '✅' if data['strength_training'] else '❌',
+                    'Weight': f"{data['weight']:.1f}" if data['weight'] else '-'
                 })
             else:
-                daily_df.append({
-                    'Day': day_name,
-                    'Date': day_date.strftime("%m/%d"),
-                    'Treadmill': '-',
-                    'Steps': '-', # Changed label
-                    'Lunch Walk': '-',
-                    'Total Exercise': '-',
-                    'Strength': '-',
-                    'Weight': '-'
-                })
+                row = EMPTY_DAY_ROW.copy()
+                row['Day'] = DAY_NAMES[i]
+                row['Date'] = day_mmdd
+                daily_df.append(row)
         
         df = pd.DataFrame(daily_df)
         st.dataframe(df, use_container_width=True)
@@ -345,6 +501,8 @@ def show_weekly_summary():
     else:
         st.warning(f"No data logged for Week {selected_week} yet.")
 
+# Fragment so switching months reruns only this panel
+@st.fragment
 def show_monthly_summary():
     st.header("📊 Monthly Summary")
     
@@ -353,25 +511,22 @@ def show_monthly_summary():
         st.warning("No data available yet.")
         return
     
-    dates = [datetime.strptime(d, "%Y-%m-%d").date() for d in st.session_state.tracker_data.keys()]
-    months = sorted(list(set((d.year, d.month) for d in dates)))
-    
+    df = get_tracker_df()
+    date_index = get_date_index()
+    months = sorted(date_index['by_month'])
+
     if months:
         month_options = [f"{calendar.month_name[month]} {year}" for year, month in months]
         selected_month = st.selectbox("Select Month:", month_options)
-        
+
         # Parse selected month
         year, month = months[month_options.index(selected_month)]
-        
-        # Get month data
-        month_data = {}
-        for date_str, data in st.session_state.tracker_data.items():
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if date_obj.year == year and date_obj.month == month:
-                month_data[date_str] = data
-        
-        if month_data:
-            stats = get_summary_stats(month_data)
+
+        # Get month data as a DataFrame slice via the prebuilt month index
+        month_df = df.loc[pd.to_datetime(date_index['by_month'][(year, month)], format='%Y-%m-%d')]
+
+        if not month_df.empty:
+            stats = get_summary_stats(month_df)
             
             st.subheader(f"📈 {calendar.month_name[month]} {year} Summary")
             
@@ -392,16 +547,9 @@ def show_monthly_summary():
             
             # Weekly breakdown within month
             st.subheader("📊 Weekly Trends")
-            weekly_data = {}
-            for date_str, data in month_data.items():
-                week = data.get('week', get_week_number(date_str))
-                if week not in weekly_data:
-                    weekly_data[week] = []
-                weekly_data[week].append(data)
-            
             weekly_summary = []
-            for week, week_entries in sorted(weekly_data.items()):
-                week_stats = get_summary_stats({f"day_{i}": entry for i, entry in enumerate(week_entries)})
+            for week, week_df in month_df.groupby('week'):
+                week_stats = get_summary_stats(week_df)
                 weekly_summary.append({
                     'Week': week,
                     'Days Logged': week_stats['total_days'],
@@ -423,16 +571,15 @@ def show_alltime_summary():
         st.warning("No data available yet.")
         return
     
-    stats = get_summary_stats(st.session_state.tracker_data)
-    start_date, end_date = get_program_info()
-    
+    stats = get_summary_stats(get_tracker_df())
+
     # Overall stats
     st.subheader("🎯 Overall Progress")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Days Logged", stats['total_days'])
-        st.metric("Program Progress", f"{(stats['total_days']/210)*100:.1f}%")
+        st.metric("Program Progress", f"{(stats['total_days']/PROGRAM_DAYS)*100:.1f}%")
     with col2:
         st.metric("Total Treadmill Time", f"{stats['total_treadmill']:.0f} min")
         st.metric("Total Steps", f"{stats['total_steps']:.0f}") # Changed label
@@ -448,24 +595,17 @@ def show_alltime_summary():
     if len(st.session_state.tracker_data) > 1:
         st.subheader("📈 Trends")
         
-        # Prepare data for charts
-        chart_data = []
-        for date_str, data in sorted(st.session_state.tracker_data.items()):
-            total_exercise = (data.get('treadmill_time', 0) + 
-                              (data.get('steps', 0) / 100) + # Using steps in total exercise calculation
-                              data.get('lunch_walk_time', 0))
-            chart_data.append({
-                'Date': date_str,
-                'Treadmill': data.get('treadmill_time', 0),
-                'Steps': data.get('steps', 0), # Changed variable
-                'Lunch Walk': data.get('lunch_walk_time', 0),
-                'Weight': data.get('weight', None),
-                'Total Exercise': total_exercise
-            })
-        
-        df = pd.DataFrame(chart_data)
-        df['Date'] = pd.to_datetime(df['Date'])
-        df = df.set_index('Date')
+        # Prepare data for charts straight from the columnar frame - already
+        # date-indexed and sorted, so no list-of-dicts or datetime re-parse
+        tdf = get_tracker_df()
+        total_exercise = tdf['treadmill_time'] + (tdf['steps'] / 100) + tdf['lunch_walk_time'] # Using steps in total exercise calculation
+        df = pd.DataFrame({
+            'Treadmill': tdf['treadmill_time'].to_numpy(),
+            'Steps': tdf['steps'].to_numpy(), # Changed variable
+            'Lunch Walk': tdf['lunch_walk_time'].to_numpy(),
+            'Weight': tdf['weight'].to_numpy(),
+            'Total Exercise': total_exercise.to_numpy()
+        }, index=tdf.index.rename('Date'))
         
         col1, col2 = st.columns(2)
         with col1:
@@ -474,7 +614,7 @@ def show_alltime_summary():
         
         with col2:
             st.subheader("Weight Trend")
-            weight_df = df[df['Weight'].notna()][['Weight']]
+            weight_df = df[df['Weight'] > 0][['Weight']]
             if not weight_df.empty:
                 st.line_chart(weight_df)
             else:
@@ -483,7 +623,9 @@ def show_alltime_summary():
     # Data export
     st.subheader("💾 Data Export")
     if st.button("📥 Export All Data"):
-        json_data = json.dumps(st.session_state.tracker_data, indent=2)
+        # Serialized only on click; download_button takes the bytes directly,
+        # so skip the str decode copy
+        json_data = orjson.dumps(st.session_state.tracker_data, option=orjson.OPT_INDENT_2)
         st.download_button(
             label="Download JSON",
             data=json_data,